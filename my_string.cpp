@@ -12,12 +12,11 @@ namespace my_string {
 
     std::string trim_left(const std::string &str)
     {
-        if (str.empty()) return "";
-        for (unsigned i = 0; i < str.size(); i++)
+        for (std::string::size_type i = 0; i < str.size(); i++)
         {
-            if (!std::isspace(str[i]))
+            if (!std::isspace(static_cast<unsigned char>(str[i])))
             {
-                return str.substr(i, str.size());
+                return str.substr(i);
             }
         }
         return "";
@@ -25,12 +24,11 @@ namespace my_string {
 
     std::string trim_right(const std::string &str)
     {
-        if (str.empty()) return "";
-        for (auto i = str.size() - 1; i > 0; i--)
+        for (auto i = str.size(); i > 0; i--)
         {
-            if (!std::isspace(str[i]))
+            if (!std::isspace(static_cast<unsigned char>(str[i - 1])))
             {
-                return str.substr(0, i + 1);
+                return str.substr(0, i);
             }
         }
         return "";
@@ -38,8 +36,11 @@ namespace my_string {
 
     std::string trim(const std::string &str)
     {
-        if (str.empty()) return "";
-        return trim_left(trim_right(str));
+        std::string::size_type begin = 0;
+        auto end = str.size();
+        while (begin < end && std::isspace(static_cast<unsigned char>(str[begin]))) begin++;
+        while (end > begin && std::isspace(static_cast<unsigned char>(str[end - 1]))) end--;
+        return str.substr(begin, end - begin);
     }
 
 }
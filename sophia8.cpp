@@ -1172,20 +1172,33 @@ void process_instruction()
  *
  * Prints Memory
  *
+ * Each row of 64 bytes is formatted into a line buffer and written at once,
+ * instead of calling printf for every single byte of the memory.
+ *
  */
 void print_memory()
 {
+    static const char hex_digits[] = "0123456789abcdef";
+    static char line[64 * 3];
+    uint16_t line_len = 0;
+
     for (uint16_t i = 0; i < MEM_SIZE; i++)
     {
         if (i % 64 == 0)
         {
+            fwrite(line, 1, line_len, stdout);
+            line_len = 0;
+
             // ReSharper disable once CppPrintfRiskyFormat
             printf("\n%#06x:", i);
         }
 
-        printf(" %02x", mem[i]);
+        line[line_len++] = ' ';
+        line[line_len++] = hex_digits[mem[i] >> 4];
+        line[line_len++] = hex_digits[mem[i] & 0x0F];
     }
 
+    fwrite(line, 1, line_len, stdout);
     printf("\n");
 }
 